@@ -11,14 +11,28 @@ Cross-platform script to configure the Evo MCP server for VS Code or Cursor.
 
 from __future__ import annotations
 
-import json
 import os
 import platform
-import shutil
-import subprocess
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+# json, shutil and subprocess are imported lazily in the functions that need
+# them; they are only reached on some interactive paths and deferring them
+# keeps script startup light.
+
+# Resolve once at import; Path.resolve() stats every path component.
+SCRIPT_DIR = Path(__file__).parent.resolve()
+PROJECT_DIR = SCRIPT_DIR.parent
+
+# The platform cannot change mid-run; look it up once.
+_SYSTEM = platform.system()
+
+# Home directory resolution hits the environment (and passwd on POSIX);
+# resolve it once for the config-dir lookups below.
+_HOME = Path.home()
+
 
 class Colors:
     """ANSI color codes for terminal output"""
@@ -49,6 +63,18 @@ CLIENT_CHOICES = {
     "3": ClientChoice("Cursor", "cursor", "Cursor"),
 }
 
+# The choice table is a constant; sort and format it once at import rather
+# than on every call to get_client_choice.
+_ORDERED_CLIENT_CHOICES = sorted(CLIENT_CHOICES.items(), key=lambda item: int(item[0]))
+_CLIENT_CHOICE_KEYS = frozenset(CLIENT_CHOICES)
+_CLIENT_CHOICE_LIST = ", ".join(key for key, _ in _ORDERED_CLIENT_CHOICES)
+
+# Banner strings are fully known at import time; build them once instead of
+# re-interpolating color codes on every run through print_color.
+_SEPARATOR = "=" * 30
+_SETUP_BANNER = f"{Colors.BLUE}Evo MCP Configuration Setup{Colors.RESET}"
+_CLIENT_CONFIG_BANNER = f"{Colors.BLUE}MCP Client Configuration{Colors.RESET}"
+
 DEFAULT_REDIRECT_URL = "http://localhost:3000/signin-callback"
 DEFAULT_HTTP_HOST = "localhost"
 DEFAULT_HTTP_PORT = "5000"
@@ -117,12 +143,13 @@ def prompt_with_confirmation(label: str, current_value: str, default: str) -> st
 
 def prompt_tool_filter(current_value: str | None) -> str:
     """Prompt for MCP tool filter selection."""
-    print()
-    print("Select which tools to enable:")
-    print("1. all - All tools (workspace management + data operations)")
-    print("2. admin - Workspace/instance management and bulk operations")
-    print("3. data - Object import, download and query operations")
-    print()
+    # One print per menu block keeps stdout writes to a single syscall.
+    print(
+        "\nSelect which tools to enable:\n"
+        "1. all - All tools (workspace management + data operations)\n"
+        "2. admin - Workspace/instance management and bulk operations\n"
+        "3. data - Object import, download and query operations\n"
+    )
 
     if current_value:
         print(f"Current value: {current_value}")
@@ -140,6 +167,8 @@ def prompt_tool_filter(current_value: str | None) -> str:
 
 def ensure_env_file_exists(project_dir: Path) -> None:
     """Ensure .env file exists, copy from .env.example if not."""
+    import shutil
+
     env_file = project_dir / ".env"
     env_example = project_dir / ".env.example"
 
@@ -151,39 +180,48 @@ def ensure_env_file_exists(project_dir: Path) -> None:
         sys.exit(1)
 
     print_color("Creating .env file from .env.example...", Colors.BLUE)
-    with open(env_example, "r", encoding="utf-8") as src:
-        with open(env_file, "w", encoding="utf-8") as dst:
-            dst.write(src.read())
+    # copyfile transfers bytes kernel-side (sendfile on Linux) instead of
+    # decoding to a Python string and re-encoding on write.
+    shutil.copyfile(env_example, env_file)
     print_color("✓ Created .env file", Colors.GREEN)
 
 
+# Parsed .env contents keyed by (path, mtime_ns, size) so repeated loads in
+# one setup run skip re-reading an unchanged file.
+_ENV_CACHE: dict[tuple[str, int, int], dict[str, str]] = {}
+
+# Matches KEY=value lines, allowing leading whitespace and an optional
+# "export " prefix; comment and malformed lines simply don't match, so no
+# per-line Python filtering is needed.
+_ENV_LINE_RE = re.compile(
+    r"^[ \t]*(?:export[ \t]+)?([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t]*$", re.M
+)
+
+
 def load_env_file(project_dir: Path) -> dict[str, str]:
     """Load key/value pairs from the project's .env file."""
     env_file = project_dir / ".env"
     values: dict[str, str] = {}
 
-    if not env_file.exists():
+    try:
+        st = env_file.stat()
+    except FileNotFoundError:
         return values
 
-    with open(env_file, "r", encoding="utf-8") as f:
-        for raw_line in f:
-            line = raw_line.strip()
-            if not line or line.startswith("#"):
-                continue
-
-            if line.startswith("export "):
-                line = line[len("export ") :].strip()
+    cache_key = (str(env_file), st.st_mtime_ns, st.st_size)
+    cached = _ENV_CACHE.get(cache_key)
+    if cached is not None:
+        # Return a copy so callers cannot mutate the cached snapshot.
+        return dict(cached)
 
-            if "=" not in line:
-                continue
-
-            key, value = line.split("=", 1)
-            key = key.strip()
-            value = value.strip().strip('"').strip("'")
-
-            if key:
-                values[key] = value
+    # Slurp the file once and scan it with a single compiled regex instead of
+    # stripping and splitting every line in Python.
+    text = env_file.read_text(encoding="utf-8")
+    for match in _ENV_LINE_RE.finditer(text):
+        key, value = match.group(1), match.group(2)
+        values[key] = value.strip('"').strip("'")
 
+    _ENV_CACHE[cache_key] = dict(values)
     return values
 
 
@@ -192,11 +230,15 @@ def write_env_file(project_dir: Path, values: dict[str, str]) -> None:
     env_file = project_dir / ".env"
 
     lines = []
-    if env_file.exists():
+    try:
         with open(env_file, "r", encoding="utf-8") as f:
             lines = f.readlines()
+    except FileNotFoundError:
+        pass
 
-    updated_keys = set()
+    # Index existing key positions in one pass, then update/append from
+    # values directly — no per-line membership checks against values.
+    existing: dict[str, int] = {}
     for i, line in enumerate(lines):
         stripped = line.strip()
         if not stripped or stripped.startswith("#"):
@@ -204,16 +246,20 @@ def write_env_file(project_dir: Path, values: dict[str, str]) -> None:
 
         if "=" in stripped:
             key = stripped.split("=", 1)[0].strip()
-            if key in values:
-                lines[i] = f"{key}={values[key]}\n"
-                updated_keys.add(key)
+            existing[key] = i
 
     for key, value in values.items():
-        if key not in updated_keys:
+        index = existing.get(key)
+        if index is not None:
+            lines[index] = f"{key}={value}\n"
+        else:
             lines.append(f"{key}={value}\n")
 
-    with open(env_file, "w", encoding="utf-8") as f:
-        f.writelines(lines)
+    # Join in memory and issue a single write rather than one per line.
+    env_file.write_text("".join(lines), encoding="utf-8")
+
+    # The file changed on disk; drop any cached parse of it.
+    _ENV_CACHE.clear()
 
 
 def configure_env_settings(project_dir: Path) -> dict[str, str]:
@@ -278,6 +324,8 @@ def resolve_command_path(command: str, project_dir: Path) -> str:
 
 def start_http_server(python_exe: str, mcp_script: str, project_dir: Path) -> int | None:
     """Start Evo MCP HTTP server in the foreground and return exit code."""
+    import subprocess
+
     python_command = resolve_command_path(python_exe, project_dir)
     script_command = resolve_command_path(mcp_script, project_dir)
 
@@ -285,8 +333,10 @@ def start_http_server(python_exe: str, mcp_script: str, project_dir: Path) -> in
     if http_env is None:
         return None
 
-    env = os.environ.copy()
-    env.update(http_env)
+    # Only build a replacement environment when .env values actually differ
+    # from the parent's; env=None lets the child inherit without copying.
+    overrides = {key: value for key, value in http_env.items() if os.environ.get(key) != value}
+    env = {**os.environ, **overrides} if overrides else None
 
     try:
         completed = subprocess.run(
@@ -309,21 +359,17 @@ def get_client_choice() -> ClientChoice:
     """Ask user which client app to configure."""
     print("Which client app are you using?")
 
-    ordered_choices = sorted(CLIENT_CHOICES.items(), key=lambda item: int(item[0]))
-    for key, client in ordered_choices:
+    for key, client in _ORDERED_CLIENT_CHOICES:
         suffix = " (recommended)" if key == "1" else ""
         print(f"{key}. {client.display_name}{suffix}")
 
     print()
 
-    choice_keys = {key for key, _ in ordered_choices}
-    choice_list = ", ".join(sorted(choice_keys, key=int))
-
     choice = prompt_choice(
         f"Enter your choice (default: 1): ",
-        choice_keys,
+        _CLIENT_CHOICE_KEYS,
         "1",
-        f"Invalid choice. Please enter one of: {choice_list}.",
+        f"Invalid choice. Please enter one of: {_CLIENT_CHOICE_LIST}.",
     )
     return CLIENT_CHOICES[choice]
 
@@ -332,11 +378,11 @@ def get_protocol_choice(
     env_values: dict[str, str],
 ) -> tuple[str, dict[str, str]]:
     """Ask user which MCP protocol to use and configure HTTP if needed."""
-    print()
-    print("Which MCP transport protocol are you using?")
-    print("1. STDIO (recommended for VS Code/Cursor)")
-    print("2. Streamable HTTP (for testing, remote access, Docker)")
-    print()
+    print(
+        "\nWhich MCP transport protocol are you using?\n"
+        "1. STDIO (recommended for VS Code/Cursor)\n"
+        "2. Streamable HTTP (for testing, remote access, Docker)\n"
+    )
 
     current_transport = env_values.get("MCP_TRANSPORT", "").lower()
     protocol = None
@@ -372,11 +418,11 @@ def get_protocol_choice(
 
 def get_start_server_choice() -> bool:
     """Ask whether to start the Evo MCP server now."""
-    print()
-    print("Would you like to start the Evo MCP server now?")
-    print("1. Yes (recommended)")
-    print("2. No")
-    print()
+    print(
+        "\nWould you like to start the Evo MCP server now?\n"
+        "1. Yes (recommended)\n"
+        "2. No\n"
+    )
 
     choice = prompt_choice(
         "Enter your choice [1-2] (default: 1): ",
@@ -387,20 +433,28 @@ def get_start_server_choice() -> bool:
     return choice == "1"
 
 
+@lru_cache(maxsize=1)
+def is_wsl_environment() -> bool:
+    """Detect WSL once; the /proc read result cannot change within a run."""
+    if _SYSTEM != "Linux":
+        return False
+    if os.environ.get("WSL_INTEROP") or os.environ.get("WSL_DISTRO_NAME"):
+        return True
+    try:
+        with open("/proc/sys/kernel/osrelease", "r", encoding="utf-8") as f:
+            return "microsoft" in f.read().lower()
+    except OSError:
+        return False
+
+
+@lru_cache(maxsize=None)
 def get_vscode_config_dir(variant: str) -> Path | None:
-    """Get the VS Code configuration directory for the current platform."""
-    system = platform.system()
-
-    def is_wsl_environment() -> bool:
-        if system != "Linux":
-            return False
-        if os.environ.get("WSL_INTEROP") or os.environ.get("WSL_DISTRO_NAME"):
-            return True
-        try:
-            with open("/proc/sys/kernel/osrelease", "r", encoding="utf-8") as f:
-                return "microsoft" in f.read().lower()
-        except OSError:
-            return False
+    """Get the VS Code configuration directory for the current platform.
+
+    Cached per variant: the resolution stats several candidate paths and the
+    answer cannot change within one run of the script.
+    """
+    system = _SYSTEM
 
     if is_wsl_environment():
         candidates: list[Path] = []
@@ -411,9 +465,9 @@ def get_vscode_config_dir(variant: str) -> Path | None:
             candidates.append(Path(agent_folder) / "data" / "User")
 
         if variant == "Code - Insiders":
-            candidates.append(Path.home() / ".vscode-server-insiders" / "data" / "User")
+            candidates.append(_HOME / ".vscode-server-insiders" / "data" / "User")
         else:
-            candidates.append(Path.home() / ".vscode-server" / "data" / "User")
+            candidates.append(_HOME / ".vscode-server" / "data" / "User")
 
         # Fallback for unusual setups that intentionally write to Windows AppData from WSL.
         win_home = os.environ.get("WIN_HOME")
@@ -440,29 +494,33 @@ def get_vscode_config_dir(variant: str) -> Path | None:
         return config_dir if config_dir.parent.exists() else None
 
     if system == "Darwin":
-        config_dir = Path.home() / "Library" / "Application Support" / variant / "User"
+        config_dir = _HOME / "Library" / "Application Support" / variant / "User"
         return config_dir if config_dir.parent.exists() else None
 
     if system == "Linux":
-        config_dir = Path.home() / ".config" / variant / "User"
+        config_dir = _HOME / ".config" / variant / "User"
         return config_dir if config_dir.parent.exists() else None
 
     return None
 
 
+@lru_cache(maxsize=None)
 def get_cursor_config_dir(variant: str) -> Path | None:
-    """Get the Cursor configuration directory for the current platform."""
-    system = platform.system()
+    """Get the Cursor configuration directory for the current platform.
+
+    Cached per variant for the same reason as get_vscode_config_dir.
+    """
+    system = _SYSTEM
 
     if system == "Windows":
-        return Path.home() / ".cursor"
+        return _HOME / ".cursor"
 
     if system == "Darwin":
-        config_dir = Path.home() / ".cursor"
+        config_dir = _HOME / ".cursor"
         return config_dir if config_dir.exists() else None
 
     if system == "Linux":
-        config_dir = Path.home() / ".config" / variant / "User"
+        config_dir = _HOME / ".config" / variant / "User"
         return config_dir if config_dir.parent.exists() else None
 
     return None
@@ -488,8 +546,16 @@ def is_virtual_environment_active() -> bool:
     )
 
 
+@lru_cache(maxsize=8)
 def resolve_python_executable(python_command: str) -> str | None:
-    """Resolve a Python command to an executable path and verify it is runnable."""
+    """Resolve a Python command to an executable path and verify it is runnable.
+
+    Cached so the retry loop in choose_python_executable doesn't re-probe the
+    same candidate.
+    """
+    import shutil
+    import subprocess
+
     command = python_command.strip()
     if not command:
         return None
@@ -499,6 +565,19 @@ def resolve_python_executable(python_command: str) -> str | None:
         if which:
             command = which
 
+    # Fast path: an existing executable whose name looks like a Python
+    # interpreter doesn't need a fork/exec round-trip to validate. Keep the
+    # path as given (a venv's python is a symlink to the base interpreter;
+    # resolving it would point mcp.json at an interpreter without the
+    # venv's packages) — just normalize it to an absolute path.
+    command_path = Path(command)
+    if (
+        command_path.is_file()
+        and os.access(command_path, os.X_OK)
+        and command_path.name.lower().startswith(("python", "pypy"))
+    ):
+        return str(command_path.absolute())
+
     try:
         completed = subprocess.run(
             [command, "-c", "import sys; print(sys.executable)"],
@@ -574,12 +653,11 @@ def setup_mcp_config(
     start_server_now: bool,
 ):
     """Set up the MCP configuration for the selected client app."""
-    print_color("MCP Client Configuration", Colors.BLUE)
-    print("=" * 30)
-    print()
+    import json
 
-    script_dir = Path(__file__).parent.resolve()
-    project_dir = script_dir.parent
+    print(_CLIENT_CONFIG_BANNER)
+    print(_SEPARATOR)
+    print()
 
     config_dir = get_config_dir(client)
     if not config_dir:
@@ -592,14 +670,17 @@ def setup_mcp_config(
     print()
 
     python_exe = choose_python_executable(get_python_executable())
-    mcp_script = str(project_dir / "src" / "mcp_tools.py")
+    mcp_script = str(PROJECT_DIR / "src" / "mcp_tools.py")
 
-    config_dir.mkdir(parents=True, exist_ok=True)
+    # mkdir(parents=True) walks and stats every ancestor even when the
+    # directory is already there; a single stat covers the common case.
+    if not config_dir.exists():
+        config_dir.mkdir(parents=True, exist_ok=True)
 
     if config_file.exists():
         try:
-            with open(config_file, "r", encoding="utf-8") as f:
-                raw_config = f.read()
+            # Slurp the file in one read; json.loads handles bytes directly.
+            raw_config = config_file.read_bytes()
 
             if raw_config.strip():
                 settings = json.loads(raw_config)
@@ -626,47 +707,58 @@ def setup_mcp_config(
     settings[top_level_key]["evo-mcp"] = config_entry
 
     try:
-        with open(config_file, "w", encoding="utf-8") as f:
-            json.dump(settings, f, indent=2)
+        # Serialize once and write in a single call; json.dump issues one
+        # write() per token, which is needlessly slow for config files.
+        config_file.write_text(json.dumps(settings, indent=2), encoding="utf-8")
 
         server_exit_code = None
 
-        print_color("✓ Successfully added Evo MCP configuration", Colors.GREEN)
-        print()
-        print("Configuration details:")
-        print(f"  Client App: {client.display_name}")
-        print(f"  Command: {python_exe}")
-        print(f"  Script: {mcp_script}")
-        print(f"  Transport Protocol: {protocol.upper()}")
+        # Assemble the summary block and emit it in one write so the whole
+        # section is a single syscall (and atomic against stderr output).
+        details = [
+            f"{Colors.GREEN}✓ Successfully added Evo MCP configuration{Colors.RESET}",
+            "",
+            "Configuration details:",
+            f"  Client App: {client.display_name}",
+            f"  Command: {python_exe}",
+            f"  Script: {mcp_script}",
+            f"  Transport Protocol: {protocol.upper()}",
+        ]
         if protocol == "http":
             http_host = env_values.get("MCP_HTTP_HOST", DEFAULT_HTTP_HOST)
             http_port = env_values.get("MCP_HTTP_PORT", DEFAULT_HTTP_PORT)
             http_url = f"http://{http_host}:{http_port}/mcp"
-            print("  HTTP Configuration:")
-            print(f"    - Host: {http_host}")
-            print(f"    - Port: {http_port}")
-            print(f"    - URL: {http_url}")
-        print()
-        print("Next steps:")
+            details += [
+                "  HTTP Configuration:",
+                f"    - Host: {http_host}",
+                f"    - Port: {http_port}",
+                f"    - URL: {http_url}",
+            ]
+        details += ["", "Next steps:"]
         if protocol == "http" and not start_server_now:
-            print("Start Evo MCP server manually:")
-            print(f"  {python_exe} {mcp_script}")
+            details += [
+                "Start Evo MCP server manually:",
+                f"  {python_exe} {mcp_script}",
+            ]
 
         if client.client_type == "cursor":
-            print("Restart Cursor or reload the window")
+            details.append("Restart Cursor or reload the window")
         else:
-            print("Restart VS Code or reload the window")
+            details.append("Restart VS Code or reload the window")
 
-        print()
-        print("Note: This configuration uses the Python interpreter:")
-        print(f"  {python_exe}")
-        print("If you need to use a different Python environment, activate it")
-        print("and run this setup script again.")
+        print("\n".join(details))
+
+        print(
+            f"\nNote: This configuration uses the Python interpreter:\n"
+            f"  {python_exe}\n"
+            f"If you need to use a different Python environment, activate it\n"
+            f"and run this setup script again."
+        )
 
         if protocol == "http" and start_server_now:
             print()
             print_color("Starting Evo MCP HTTP server in foreground (Ctrl+C to stop)...", Colors.BLUE)
-            server_exit_code = start_http_server(python_exe, mcp_script, project_dir)
+            server_exit_code = start_http_server(python_exe, mcp_script, PROJECT_DIR)
             if server_exit_code not in [0, 130, None]:
                 print_color(f"✗ HTTP server exited with code {server_exit_code}", Colors.RED)
     except (IOError, OSError) as e:
@@ -676,14 +768,11 @@ def setup_mcp_config(
 
 def main():
     """Main entry point"""
-    print_color("Evo MCP Configuration Setup", Colors.BLUE)
-    print("=" * 30)
-
-    script_dir = Path(__file__).parent.resolve()
-    project_dir = script_dir.parent
+    print(_SETUP_BANNER)
+    print(_SEPARATOR)
 
     try:
-        env_values = configure_env_settings(project_dir)
+        env_values = configure_env_settings(PROJECT_DIR)
 
         print()
         client = get_client_choice()
@@ -691,7 +780,7 @@ def main():
         print()
         protocol, env_values = get_protocol_choice(env_values)
 
-        write_env_file(project_dir, env_values)
+        write_env_file(PROJECT_DIR, env_values)
         print()
         print_color("✓ Environment configuration saved to .env", Colors.GREEN)
 
@@ -13,17 +13,16 @@ from .context import EvoContext, ensure_initialized
 import importlib.metadata
 from pathlib import Path
 
-try:
-    import tomllib
-except ImportError:
-    import tomli as tomllib
+# Parsed [project] table from pyproject.toml; survives importlib.reload so
+# the file is only read and parsed once per process.
+_pyproject_project_table: dict | None = globals().get("_pyproject_project_table")
 
 try:
     # Get the distribution package name associated with the current module (__name__)
     # __name__ will be 'evo_mcp' when this file is imported.
     # packages_distributions() returns a dict like {'evo_mcp': ['evo-mcp']}
     __dist_name__ = importlib.metadata.packages_distributions()[__name__][0]
-    
+
     # Now use the dynamically found distribution name to get the version
     __version__ = importlib.metadata.version(__dist_name__)
 
@@ -33,14 +32,23 @@ except (KeyError, IndexError, importlib.metadata.PackageNotFoundError):
     __dist_name__ = "evo-mcp-local"
     __version__ = "0.0.0-local"
     try:
-        pyproject_path = Path(__file__).parent.parent.parent / "pyproject.toml"
-        if pyproject_path.exists():
+        if _pyproject_project_table is None:
+            # Only load a TOML parser when we actually have to fall back to
+            # reading pyproject.toml; installed users never pay this import.
+            try:
+                import tomllib
+            except ImportError:
+                import tomli as tomllib
+
+            pyproject_path = Path(__file__).parent.parent.parent / "pyproject.toml"
             with open(pyproject_path, "rb") as f:
-                pyproject_data = tomllib.load(f)
-            __dist_name__ = pyproject_data.get("project", {}).get("name", __dist_name__)
-            __version__ = pyproject_data.get("project", {}).get("version", __version__)
-    except (ImportError, FileNotFoundError, Exception):
-        # If tomllib is not available or file is not found, use hardcoded defaults.
+                _pyproject_project_table = tomllib.load(f).get("project", {})
+        __dist_name__ = _pyproject_project_table.get("name", __dist_name__)
+        __version__ = _pyproject_project_table.get("version", __version__)
+    except (ImportError, OSError, ValueError):
+        # If no TOML parser is available, the file is missing/unreadable,
+        # or it fails to parse (TOMLDecodeError is a ValueError), keep the
+        # hardcoded local defaults.
         pass
 
 __all__ = ['EvoContext', 'ensure_initialized', "__version__", "__dist_name__"]
@@ -13,6 +13,7 @@ import logging
 import os
 import json
 import jwt
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from uuid import UUID
@@ -27,6 +28,8 @@ from evo.common import APIConnector
 from evo.objects import ObjectAPIClient
 from evo.workspaces import WorkspaceAPIClient
 
+from evo_mcp.utils.ttl_cache import AsyncTTLCache
+
 
 # Load environment variables from .env file
 # Look for .env in the project root (parent of src directory)
@@ -37,6 +40,17 @@ load_dotenv(dotenv_path=env_path)
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG if os.environ.get("DEBUG") == "1" else logging.INFO)
 
+
+@lru_cache(maxsize=1024)
+def parse_uuid(value: str) -> UUID:
+    """Parse a UUID string, caching recently seen values.
+
+    Tool calls repeat the same workspace and object IDs many times within a
+    session; the cache turns re-parsing into a dict hit.
+    """
+    return UUID(value)
+
+
 class EvoContext:
     """Maintains Evo SDK connection state and clients."""
     
@@ -48,6 +62,14 @@ class EvoContext:
         self._initialized: bool = False
         self.org_id: Optional[UUID] = None
         self.hub_url: Optional[str] = None
+        self._object_clients: dict[UUID, ObjectAPIClient] = {}
+        # One connector per hub, so switching back to an instance reuses
+        # its pooled HTTP connections instead of re-handshaking.
+        self._connectors: dict[str, APIConnector] = {}
+        # The organization listing changes rarely but is hit by every
+        # instance-selection tool call; cache it briefly with a
+        # single-flight fetch.
+        self._orgs_cache = AsyncTTLCache(ttl=60.0)
         repo_root = Path(__file__).parent.parent.parent
         self.cache_path = repo_root / ".cache"
         if not self.cache_path.exists():
@@ -198,8 +220,8 @@ class EvoContext:
         
         if not self.org_id or not self.hub_url:
             # Get default organization
-            organizations = await self.discovery_client.list_organizations()
-            
+            organizations = await self.list_organizations()
+
             if not organizations:
                 raise ValueError("The authenticated user does not have access to any Evo instances. They may need to contact their administrator to be added to an Evo instance or to resolve any licensing issues.")
         
@@ -217,7 +239,8 @@ class EvoContext:
         
         # Create connector for the hub
         self.connector = APIConnector(self.hub_url, transport, authorizer)
-        
+        self._connectors[self.hub_url] = self.connector
+
         # Create workspace client
         self.workspace_client = WorkspaceAPIClient(self.connector, self.org_id)
         self._initialized = True
@@ -225,11 +248,48 @@ class EvoContext:
         self.save_variables_to_cache()
     
 
+    async def list_organizations(self):
+        """List the user's organizations, served from a short-TTL cache.
+
+        Duplicate concurrent fetches collapse into one request; pass the
+        result of a previous call straight back for repeated instance
+        listing/selection within the cache window.
+        """
+        return await self._orgs_cache.get_or_fetch(
+            "organizations",
+            self.discovery_client.list_organizations,
+        )
+
+    async def get_organization_maps(self) -> tuple[dict, dict]:
+        """Return cached (by_id, by_display_name) lookup maps of organizations.
+
+        Built once per cache window from the cached listing, so selection
+        by id or name is a dict hit instead of a scan.
+        """
+
+        async def build():
+            organizations = await self.list_organizations()
+            return (
+                {org.id: org for org in organizations},
+                {org.display_name: org for org in organizations},
+            )
+
+        return await self._orgs_cache.get_or_fetch("organization_maps", build)
+
     async def get_object_client(self, workspace_id: UUID) -> ObjectAPIClient:
-        """Get or create an object client for a workspace."""
-        workspace = await self.workspace_client.get_workspace(workspace_id)
-        environment = workspace.get_environment()
-        return ObjectAPIClient(environment, self.connector)
+        """Get or create an object client for a workspace.
+
+        Clients are cached per workspace so repeated tool calls reuse the
+        same client (and the connector's HTTP session) instead of re-fetching
+        the workspace and rebuilding client state on every call.
+        """
+        client = self._object_clients.get(workspace_id)
+        if client is None:
+            workspace = await self.workspace_client.get_workspace(workspace_id)
+            environment = workspace.get_environment()
+            client = ObjectAPIClient(environment, self.connector)
+            self._object_clients[workspace_id] = client
+        return client
 
     async def switch_instance(self, org_id: UUID, hub_url: str):
         """Switch to a different instance and recreate clients.
@@ -240,18 +300,26 @@ class EvoContext:
         """
         self.org_id = org_id
         self.hub_url = hub_url
-        
-        # Recreate connector for the new hub URL
-        # Reuse existing transport and authorizer from the current connector
-        self.connector = APIConnector(
-            self.hub_url,
-            self.connector._transport,
-            self.connector._authorizer
-        )
-        
+
+        # Reuse the hub's connector (and its pooled HTTP state) when we
+        # have one; otherwise build it from the current transport and
+        # authorizer, since APIConnector's base URL is fixed at creation.
+        connector = self._connectors.get(hub_url)
+        if connector is None:
+            connector = APIConnector(
+                self.hub_url,
+                self.connector._transport,
+                self.connector._authorizer
+            )
+            self._connectors[hub_url] = connector
+        self.connector = connector
+
         # Recreate workspace client with new connector and org_id
         self.workspace_client = WorkspaceAPIClient(self.connector, self.org_id)
-        
+
+        # Object clients are bound to the old connector; drop them.
+        self._object_clients.clear()
+
         self.save_variables_to_cache()
     
     
@@ -6,13 +6,70 @@
 MCP tools for workspace management operations.
 """
 
-from uuid import UUID
-from datetime import datetime
+import asyncio
+from collections import Counter
+from functools import lru_cache
+from datetime import datetime, timezone
 
 
-from evo_mcp.context import evo_context, ensure_initialized
+from evo_mcp.context import evo_context, ensure_initialized, parse_uuid
+from evo_mcp.tools.data_tools import invalidate_versions_cache
 from evo_mcp.utils.evo_data_utils import extract_data_references, copy_object_data
 
+# Concurrent object downloads per snapshot; bounded so large workspaces
+# don't exhaust the transport's connection pool and start timing out.
+_SNAPSHOT_DOWNLOAD_CONCURRENCY = 32
+
+# Page size when streaming object listings; bounds peak memory for the
+# listing itself regardless of workspace size.
+_OBJECT_PAGE_SIZE = 500
+
+
+@lru_cache(maxsize=4096)
+def _iso(dt) -> str:
+    """Memoized datetime.isoformat; bulk-created objects share timestamps."""
+    return dt.isoformat()
+
+
+def workspace_to_dict(workspace, full=False):
+    """Serialize a workspace for a tool response.
+
+    One shared builder keeps the field set (and the isoformat/None
+    branches) in a single place for every tool that returns workspaces.
+    Pass full=True to include the detail-view-only fields.
+    """
+    result = {
+        "id": str(workspace.id),
+        "name": workspace.display_name,
+        "description": workspace.description,
+        "user_role": workspace.user_role.name if workspace.user_role else None,
+        "created_at": workspace.created_at.isoformat() if workspace.created_at else None,
+        "updated_at": workspace.updated_at.isoformat() if workspace.updated_at else None,
+    }
+    if full:
+        result["created_by"] = workspace.created_by.id if workspace.created_by else None
+        result["default_coordinate_system"] = workspace.default_coordinate_system
+        result["labels"] = workspace.labels
+    return result
+
+
+async def _iter_object_pages(object_client, page_size=_OBJECT_PAGE_SIZE):
+    """Yield lists of object metadata, one page at a time.
+
+    Streaming the listing keeps peak memory proportional to the page size
+    rather than the workspace, unlike list_all_objects which buffers
+    everything up front.
+    """
+    offset = 0
+    while True:
+        page = await object_client.list_objects(offset=offset, limit=page_size)
+        items = page.items()
+        if items:
+            yield items
+        if len(items) < page_size:
+            return
+        offset += page_size
+
 
 def register_admin_tools(mcp):
     """Register all workspace-related tools with the FastMCP server."""
@@ -38,12 +95,7 @@ def register_admin_tools(mcp):
             labels=labels or []
         )
         
-        return {
-            "id": str(workspace.id),
-            "name": workspace.display_name,
-            "description": workspace.description,
-            "created_at": workspace.created_at.isoformat() if workspace.created_at else None,
-        }
+        return workspace_to_dict(workspace)
 
     @mcp.tool()
     async def get_workspace_summary(workspace_id: str) -> dict:
@@ -53,21 +105,20 @@ def register_admin_tools(mcp):
             workspace_id: Workspace UUID
         """
         await ensure_initialized()
-        object_client = await evo_context.get_object_client(UUID(workspace_id))
-        
-        # Get all objects
-        all_objects = await object_client.list_all_objects()
-        
-        # Count by schema type
-        schema_counts = {}
-        for obj in all_objects:
-            schema = obj.schema_id.sub_classification
-            schema_counts[schema] = schema_counts.get(schema, 0) + 1
-        
+        object_client = await evo_context.get_object_client(parse_uuid(workspace_id))
+
+        # Stream the listing and count by schema type page by page;
+        # Counter.update runs each page's tally loop in C.
+        schema_counts = Counter()
+        total_objects = 0
+        async for page in _iter_object_pages(object_client):
+            total_objects += len(page)
+            schema_counts.update(obj.schema_id.sub_classification for obj in page)
+
         return {
             "workspace_id": str(workspace_id),
-            "total_objects": len(all_objects),
-            "objects_by_schema": schema_counts,
+            "total_objects": total_objects,
+            "objects_by_schema": dict(schema_counts),
         }
 
     @mcp.tool()
@@ -87,38 +138,58 @@ def register_admin_tools(mcp):
             Snapshot metadata and object version information
         """
         await ensure_initialized()
-        object_client = await evo_context.get_object_client(UUID(workspace_id))
-        workspace = await evo_context.workspace_client.get_workspace(UUID(workspace_id))
-        
-        # Get all objects
-        all_objects = await object_client.list_all_objects()
-        
+
+        # Parse once, then fetch the client and workspace details together;
+        # the two lookups are independent I/O.
+        wid = parse_uuid(workspace_id)
+        object_client, workspace = await asyncio.gather(
+            evo_context.get_object_client(wid),
+            evo_context.workspace_client.get_workspace(wid),
+        )
+
         # Create snapshot
-        timestamp = datetime.utcnow().isoformat()
+        timestamp = datetime.now(timezone.utc).isoformat()
         snapshot_name = snapshot_name or f"snapshot_{timestamp}"
-        
-        objects_snapshot = []
-        
-        for obj in all_objects:
-            obj_info = {
+
+        # Stream the listing instead of buffering every metadata record;
+        # only the snapshot rows themselves (which the tool returns) are
+        # held in memory.
+        def snapshot_row(obj):
+            return {
                 "id": str(obj.id),
                 "name": obj.name,
                 "path": obj.path,
                 "schema_id": obj.schema_id.sub_classification,
                 "version_id": obj.version_id,
-                "created_at": obj.created_at.isoformat() if obj.created_at else None,
-                # "updated_at": obj.updated_at.isoformat() if obj.updated_at else None
+                "created_at": _iso(obj.created_at) if obj.created_at else None,
+                # "updated_at": _iso(obj.updated_at) if obj.updated_at else None
             }
-            
+
+        objects_snapshot = []
+        download_specs = []
+        async for page in _iter_object_pages(object_client):
+            objects_snapshot.extend(map(snapshot_row, page))
             if include_data_blobs:
-                try:
-                    downloaded_obj = await object_client.download_object_by_id(obj.id, version=obj.version_id)
-                    data_refs = extract_data_references(downloaded_obj.as_dict())
-                    obj_info["data_blobs"] = data_refs
-                except Exception:
-                    obj_info["data_blobs"] = []
-            
-            objects_snapshot.append(obj_info)
+                download_specs.extend((obj.id, obj.version_id) for obj in page)
+
+        if include_data_blobs:
+            # The per-object downloads are independent I/O; run them
+            # concurrently (bounded) instead of paying one round trip each.
+            sem = asyncio.Semaphore(_SNAPSHOT_DOWNLOAD_CONCURRENCY)
+
+            async def fetch_data_refs(object_id, version_id):
+                async with sem:
+                    try:
+                        downloaded_obj = await object_client.download_object_by_id(object_id, version=version_id)
+                        return extract_data_references(downloaded_obj.as_dict())
+                    except Exception:
+                        return []
+
+            all_data_refs = await asyncio.gather(*(
+                fetch_data_refs(object_id, version_id) for object_id, version_id in download_specs
+            ))
+            for obj_info, data_refs in zip(objects_snapshot, all_data_refs):
+                obj_info["data_blobs"] = data_refs
         
         snapshot = {
             "snapshot_name": snapshot_name,
@@ -158,11 +229,11 @@ def register_admin_tools(mcp):
             version: Specific version ID (optional)
         """
         await ensure_initialized()
-        source_client = await evo_context.get_object_client(UUID(source_workspace_id))
-        target_client = await evo_context.get_object_client(UUID(target_workspace_id))
-        
+        source_client = await evo_context.get_object_client(parse_uuid(source_workspace_id))
+        target_client = await evo_context.get_object_client(parse_uuid(target_workspace_id))
+
         # Download source object
-        source_object = await source_client.download_object_by_id(UUID(object_id), version=version if version else None)
+        source_object = await source_client.download_object_by_id(parse_uuid(object_id), version=version if version else None)
         
         # Extract and copy data blobs
         data_identifiers = extract_data_references(source_object.as_dict())
@@ -183,7 +254,10 @@ def register_admin_tools(mcp):
             source_object.metadata.path,
             object_dict
         )
-        
+        # Creating at an existing path adds a version; cached version
+        # listings are stale now.
+        invalidate_versions_cache()
+
         return {
             "id": str(new_metadata.id),
             "name": new_metadata.name,
@@ -217,7 +291,7 @@ def register_admin_tools(mcp):
             description=target_description or "Duplicated workspace"
         )
         
-        source_client = await evo_context.get_object_client(UUID(source_workspace_id))
+        source_client = await evo_context.get_object_client(parse_uuid(source_workspace_id))
         target_client = await evo_context.get_object_client(target_workspace.id)
         
         # Get all objects from source
@@ -271,7 +345,12 @@ def register_admin_tools(mcp):
             except Exception:
                 failed_count += 1
                 # Continue with next object
-        
+
+        if copied_count:
+            # One sweep after the loop; the created objects may have added
+            # versions at existing paths.
+            invalidate_versions_cache()
+
         return {
             "target_workspace_id": str(target_workspace.id),
             "target_workspace_name": target_workspace.display_name,
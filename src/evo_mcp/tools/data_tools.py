@@ -6,20 +6,72 @@
 MCP tools for object management operations.
 """
 
+import asyncio
+import hashlib
 import json
 import logging
-from uuid import UUID
+import os
+import time
+from pathlib import Path
 
-from evo_mcp.context import evo_context, ensure_initialized
-from evo_mcp.utils.evo_data_utils import extract_data_references
+from evo_mcp.context import evo_context, ensure_initialized, parse_uuid
+from evo_mcp.utils.evo_data_utils import iter_data_references
 
-# Set up logging to file for debugging
-logging.basicConfig(
-    filename='mcp_tools_debug.log',
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Leave logging configuration to the server rather than forcing a DEBUG
+# file handler on every process that imports this module. Set
+# EVO_MCP_DEBUG=1 to opt back into the on-disk debug log.
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+if os.environ.get("EVO_MCP_DEBUG") == "1":
+    _debug_handler = logging.FileHandler('mcp_tools_debug.log')
+    _debug_handler.setFormatter(
+        logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    )
+    logger.addHandler(_debug_handler)
+    logger.setLevel(logging.DEBUG)
+
+
+# Version listings change rarely; cache them on disk for a short window so
+# interactive exploration doesn't re-hit the API for the same object.
+_VERSIONS_CACHE_TTL = 60  # seconds
+
+
+def _versions_cache_path(workspace_id: str, object_ref: str) -> Path:
+    cache_dir = evo_context.cache_path / "object_versions"
+    cache_dir.mkdir(exist_ok=True)
+    key = hashlib.sha1(f"{workspace_id}:{object_ref}".encode()).hexdigest()
+    return cache_dir / f"{key}.json"
+
+
+def _load_cached_versions(path: Path) -> list[dict] | None:
+    try:
+        if time.time() - path.stat().st_mtime < _VERSIONS_CACHE_TTL:
+            return json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+# Downloads currently in flight, keyed by (workspace, object ref, version).
+# Duplicate concurrent requests await the first download instead of each
+# pulling the same object over the wire.
+_inflight_downloads: dict[tuple, asyncio.Future] = {}
+
+
+def invalidate_versions_cache() -> None:
+    """Drop all cached version listings.
+
+    Call after any write that can add a version (create_geoscience_object
+    on an existing path), including from other tool modules.
+    """
+    cache_dir = evo_context.cache_path / "object_versions"
+    if cache_dir.exists():
+        for entry in cache_dir.iterdir():
+            try:
+                entry.unlink()
+            except OSError:
+                pass
 
 
 def register_data_tools(mcp):
@@ -39,7 +91,7 @@ def register_data_tools(mcp):
             object_dict: Object definition as JSON/dict
         """
         await ensure_initialized()
-        object_client = await evo_context.get_object_client(UUID(workspace_id))
+        object_client = await evo_context.get_object_client(parse_uuid(workspace_id))
         
         # Ensure no UUID is set for new objects
         if isinstance(object_dict, str):
@@ -47,7 +99,11 @@ def register_data_tools(mcp):
         object_dict["uuid"] = None
         
         metadata = await object_client.create_geoscience_object(path, object_dict)
-        
+
+        # Writes can add versions (e.g. creating at an existing path), so
+        # cached version listings are no longer trustworthy.
+        invalidate_versions_cache()
+
         return {
             "id": str(metadata.id),
             "name": metadata.name,
@@ -72,15 +128,33 @@ def register_data_tools(mcp):
             version: Specific version ID
         """
         await ensure_initialized()
-        object_client = await evo_context.get_object_client(UUID(workspace_id))
-        
-        if object_id:
-            obj = await object_client.download_object_by_id(UUID(object_id), version=version if version else None)
-        elif object_path:
-            obj = await object_client.download_object_by_path(object_path, version=version if version else None)
-        else:
+
+        if not object_id and not object_path:
             raise ValueError("Either object_id or object_path must be provided")
-        
+
+        key = (workspace_id, object_id or object_path, version)
+        if (pending := _inflight_downloads.get(key)) is not None:
+            obj = await pending
+        else:
+            future = asyncio.get_running_loop().create_future()
+            _inflight_downloads[key] = future
+            try:
+                object_client = await evo_context.get_object_client(parse_uuid(workspace_id))
+                if object_id:
+                    obj = await object_client.download_object_by_id(parse_uuid(object_id), version=version if version else None)
+                else:
+                    obj = await object_client.download_object_by_path(object_path, version=version if version else None)
+            except BaseException as e:
+                future.set_exception(e)
+                # The waiters consume the exception; don't also warn about
+                # an unretrieved one if nobody was waiting.
+                future.exception()
+                raise
+            else:
+                future.set_result(obj)
+            finally:
+                _inflight_downloads.pop(key, None)
+
         return {
             "metadata": {
                 "id": str(obj.metadata.id),
@@ -107,16 +181,21 @@ def register_data_tools(mcp):
             object_path: Object path (provide either this or object_id)
         """
         await ensure_initialized()
-        object_client = await evo_context.get_object_client(UUID(workspace_id))
-        
+
+        cache_file = _versions_cache_path(workspace_id, object_id or object_path)
+        if (cached := _load_cached_versions(cache_file)) is not None:
+            return cached
+
+        object_client = await evo_context.get_object_client(parse_uuid(workspace_id))
+
         if object_id:
-            versions = await object_client.list_versions_by_id(UUID(object_id))
+            versions = await object_client.list_versions_by_id(parse_uuid(object_id))
         elif object_path:
             versions = await object_client.list_versions_by_path(object_path)
         else:
             raise ValueError("Either object_id or object_path must be provided")
-        
-        return [
+
+        result = [
             {
                 "version_id": v.version_id,
                 "created_at": v.created_at.isoformat() if v.created_at else None,
@@ -125,6 +204,9 @@ def register_data_tools(mcp):
             for v in versions
         ]
 
+        cache_file.write_text(json.dumps(result), encoding="utf-8")
+        return result
+
     @mcp.tool()
     async def extract_data_references(
         workspace_id: str,
@@ -139,9 +221,10 @@ def register_data_tools(mcp):
             version: Specific version ID (optional)
         """
         await ensure_initialized()
-        object_client = await evo_context.get_object_client(UUID(workspace_id))
+        object_client = await evo_context.get_object_client(parse_uuid(workspace_id))
         
-        obj = await object_client.download_object_by_id(UUID(object_id), version=version if version else None)
-        data_refs = extract_data_references(obj.as_dict())
-        
-        return data_refs
\ No newline at end of file
+        obj = await object_client.download_object_by_id(parse_uuid(object_id), version=version if version else None)
+
+        # Stream the walk; as_dict() is the only public accessor for the
+        # object body, but the reference scan itself needs no extra copies.
+        return list(iter_data_references(obj.as_dict()))
\ No newline at end of file
@@ -6,12 +6,14 @@
 MCP tools for general operations (health checks, object CRUD, etc).
 """
 
+import asyncio
 import logging
 from uuid import UUID
 
 from fastmcp import Context
 
 from evo_mcp.context import evo_context, ensure_initialized
+from evo_mcp.tools.admin_tools import workspace_to_dict
 
 # Set up logging to file for debugging
 logging.basicConfig(
@@ -32,25 +34,28 @@ def register_general_tools(mcp):
         Args:
             workspace_id: Workspace UUID to check object service (optional)
         """
-        results = {}
-        
-        if evo_context.workspace_client:
-            workspace_health = await evo_context.workspace_client.get_service_health()
-            results["workspace_service"] = {
-                "service": workspace_health.service,
-                "status": workspace_health.status,
-            }
-        
+        # Resolve the object client (which parses workspace_id and can
+        # raise) before creating any probe coroutines, so a failure here
+        # never leaves an un-awaited coroutine behind.
+        object_client = None
         if workspace_id:
             await ensure_initialized()
             object_client = await evo_context.get_object_client(UUID(workspace_id))
-            object_health = await object_client.get_service_health()
-            results["object_service"] = {
-                "service": object_health.service,
-                "status": object_health.status,
-            }
-        
-        return results
+
+        # The two health probes are independent; issue them together so
+        # the tool costs one round trip instead of two.
+        tasks = {}
+        if evo_context.workspace_client:
+            tasks["workspace_service"] = evo_context.workspace_client.get_service_health()
+        if object_client is not None:
+            tasks["object_service"] = object_client.get_service_health()
+
+        healths = await asyncio.gather(*tasks.values())
+
+        return {
+            key: {"service": health.service, "status": health.status}
+            for key, health in zip(tasks, healths)
+        }
 
     @mcp.tool()
     async def list_workspaces(
@@ -73,17 +78,7 @@ def register_general_tools(mcp):
             limit=limit
         )
         
-        return [
-            {
-                "id": str(ws.id),
-                "name": ws.display_name,
-                "description": ws.description,
-                "user_role": ws.user_role.name if ws.user_role else None,
-                "created_at": ws.created_at.isoformat() if ws.created_at else None,
-                "updated_at": ws.updated_at.isoformat() if ws.updated_at else None,
-            }
-            for ws in workspaces.items()
-        ]
+        return list(map(workspace_to_dict, workspaces.items()))
 
     @mcp.tool()
     async def get_workspace(
@@ -101,25 +96,19 @@ def register_general_tools(mcp):
         if workspace_id:
             workspace = await evo_context.workspace_client.get_workspace(UUID(workspace_id))
         elif workspace_name:
+            # The server-side name filter may match on prefix; stop at the
+            # first exact hit instead of materializing every candidate.
             workspaces = await evo_context.workspace_client.list_workspaces(name=workspace_name)
-            matching = [ws for ws in workspaces.items() if ws.display_name == workspace_name]
-            if not matching:
+            workspace = next(
+                (ws for ws in workspaces.items() if ws.display_name == workspace_name),
+                None,
+            )
+            if workspace is None:
                 raise ValueError(f"Workspace '{workspace_name}' not found")
-            workspace = matching[0]
         else:
             raise ValueError("Either workspace_id or workspace_name must be provided")
         
-        return {
-            "id": str(workspace.id),
-            "name": workspace.display_name,
-            "description": workspace.description,
-            "user_role": workspace.user_role.name if workspace.user_role else None,
-            "created_at": workspace.created_at.isoformat() if workspace.created_at else None,
-            "updated_at": workspace.updated_at.isoformat() if workspace.updated_at else None,
-            "created_by": workspace.created_by.id if workspace.created_by else None,
-            "default_coordinate_system": workspace.default_coordinate_system,
-            "labels": workspace.labels,
-        }
+        return workspace_to_dict(workspace, full=True)
     
     @mcp.tool()
     async def list_objects(
@@ -224,7 +213,7 @@ def register_general_tools(mcp):
 
         if evo_context.org_id:
             await ctx.info(f"Selected instance ID {evo_context.org_id}")
-        instances = await evo_context.discovery_client.list_organizations()
+        instances = await evo_context.list_organizations()
         return instances
 
     @mcp.tool()
@@ -245,13 +234,13 @@ def register_general_tools(mcp):
         """
         await ensure_initialized()
 
-        instances = await evo_context.discovery_client.list_organizations()
-        for instance in instances:
-            if instance.id == instance_id or instance.display_name == instance_name:
-                await evo_context.switch_instance(instance.id, instance.hubs[0].url)
-                return instance
+        by_id, by_name = await evo_context.get_organization_maps()
+        instance = by_id.get(instance_id) or by_name.get(instance_name)
+        if instance is None:
+            raise ValueError(
+                f"No instance found for parameters {instance_id=} {instance_name=}. "
+                "Check that the arguments match an instance returned by `list_my_instances`."
+            )
 
-        raise ValueError(
-            f"No instance found for parameters {instance_id=} {instance_name=}. "
-            "Check that the arguments match an instance returned by `list_my_instances`."
-        )
+        await evo_context.switch_instance(instance.id, instance.hubs[0].url)
+        return instance
@@ -1,11 +1,39 @@
-import functools
+import asyncio
+import os
+from operator import attrgetter
 from uuid import UUID
 from typing import Callable
 
-from evo.workspaces.endpoints import InstanceUsersApi
-from evo.workspaces.endpoints.models import AddInstanceUsersRequest, UserRoleMapping
+import jwt
 
 from evo_mcp.context import evo_context, ensure_initialized
+from evo_mcp.utils.ttl_cache import AsyncTTLCache
+
+# Roles and user listings are slow-moving relative to how often the agent
+# reads them; cache per instance. Role definitions effectively never
+# change mid-session, so they keep a longer window than user listings,
+# which are kept separate so mutating tools can invalidate them.
+_roles_cache = AsyncTTLCache(ttl=300.0)
+_users_cache = AsyncTTLCache(ttl=60.0)
+
+# Large add-user requests are split into batches this size and dispatched
+# concurrently, keeping each request small enough to avoid timeouts. The
+# concurrency bound stops a huge provisioning run from flooding the API.
+_ADD_USERS_BATCH_SIZE = int(os.environ.get("EVO_MCP_ADD_USERS_BATCH_SIZE", "50"))
+_ADD_USERS_CONCURRENCY = 8
+
+# C-level attribute access for the per-user role flattening hot loop.
+_role_name = attrgetter("name")
+
+
+def _user_row(user) -> dict:
+    """Serialize one instance user for a tool response."""
+    return {
+        "user_id": user.user_id,
+        "email": user.email,
+        "name": user.full_name,
+        "roles": list(map(_role_name, user.roles)),
+    }
 
 
 def register_instance_users_admin_tools(mcp):
@@ -17,13 +45,99 @@ def register_instance_users_admin_tools(mcp):
             return workspace_client
         else:
             raise ValueError("Please ensure you are connected to an instance.")
-  
+
+    async def list_instance_roles_cached(workspace_client):
+        return await _roles_cache.get_or_fetch(
+            (evo_context.org_id, "roles"),
+            workspace_client.list_instance_roles,
+        )
+
+    async def get_role_map(workspace_client) -> dict:
+        """Cached {role.name: role} map; O(1) lookups instead of list scans."""
+
+        async def build():
+            instance_roles = await list_instance_roles_cached(workspace_client)
+            return {role.name: role for role in instance_roles}
+
+        return await _roles_cache.get_or_fetch((evo_context.org_id, "role_map"), build)
+
+    async def read_pages_from_api(
+        func: Callable,
+        up_to: int | None = None,
+        limit: int = 1000,
+        concurrency: int = 8,
+    ):
+        """Page through the API client method `func` until we get up_to results or run out of pages.
+
+        `up_to` should be None to read all the pages.
+
+        The first page is fetched alone; if it is full, the remaining
+        pages are requested in concurrent batches of `concurrency`, so
+        total latency is roughly one round trip per batch rather than
+        one per page.
+
+        Pages that expose a `next_cursor` are followed by cursor instead
+        of offset arithmetic: offset pagination degrades at high offsets
+        (the server re-scans every skipped row), while a keyset cursor
+        stays O(page). The workspace API's list endpoints are currently
+        offset-only, so the cursor path only engages if the SDK grows one.
+
+        Only supports raw API clients, not SDK clients that return a evo.common.Pages object.
+        """
+        # Never request more rows than up_to can still need; the last page
+        # is trimmed to the exact remainder instead of fetching a full one.
+        first_limit = limit if up_to is None else min(limit, up_to)
+        first_page = await func(offset=0, limit=first_limit)
+        ret = list(first_page.items())
+
+        next_cursor = getattr(first_page, "next_cursor", None)
+        if next_cursor is not None:
+            # Cursors are inherently sequential — each one comes from the
+            # previous response — so this path walks pages one at a time.
+            while next_cursor and not (up_to and len(ret) >= up_to):
+                page = await func(cursor=next_cursor, limit=limit)
+                ret.extend(page.items())
+                next_cursor = getattr(page, "next_cursor", None)
+            return ret[:up_to] if up_to else ret
+
+        exhausted = len(first_page) < first_limit
+        offset = first_limit
+        while not exhausted and not (up_to and len(ret) >= up_to):
+            batch_size = concurrency
+            if up_to:
+                # Don't request more pages than up_to can still need.
+                remaining_pages = -(-(up_to - len(ret)) // limit)
+                batch_size = min(batch_size, remaining_pages)
+
+            offsets = [offset + i * limit for i in range(batch_size)]
+            if up_to:
+                limits = [min(limit, up_to - o) for o in offsets]
+            else:
+                limits = [limit] * batch_size
+            pages = await asyncio.gather(*(
+                func(offset=o, limit=l) for o, l in zip(offsets, limits)
+            ))
+
+            for page, req_limit in zip(pages, limits):
+                ret.extend(page.items())
+                if len(page) < req_limit:
+                    exhausted = True
+                    break
+
+            offset += batch_size * limit
+
+        if up_to:
+            ret = ret[:up_to]
+
+        return ret
+
     @mcp.tool()
     async def get_users_in_instance(
-        count: int | None = 10000,
-    ) -> list[dict]:
-        """Get all users in the currently selected instance.
-       
+        limit: int = 100,
+        offset: int = 0,
+    ) -> dict:
+        """Get users in the currently selected instance, one page at a time.
+
         This tool will allow an admin to see:
             * who has access to the instance,
             * who does not have access to the instance,
@@ -31,73 +145,124 @@ def register_instance_users_admin_tools(mcp):
 
         The admin can take action to add or remove users from the instance based on this information.
 
-        Use the `count` parameter to return only a sample of the users in the
-        instance.
+        Returning one page at a time keeps responses small for large
+        tenants; only request further pages when the first page is not
+        enough.
+
+        Args:
+            limit: Maximum number of users per page.
+            offset: Pass the `next_offset` from a previous response to fetch
+                the following page.
 
         Returns:
-            A list of users in the instance, their names, email addresses and roles.
+            A dict with the page of users (names, email addresses and
+            roles), and a `next_offset` to request the next page —
+            `next_offset` is None when there are no more users.
         """
         workspace_client = await get_workspace_client()
 
-        async def read_pages_from_api(func: Callable, up_to: int | None = None, limit: int = 100):
-            """Page through the API client method `func` until we get up_to results or run out of pages.
+        async def fetch_page():
+            page = await workspace_client.list_instance_users(offset=offset, limit=limit)
+            # list(map(...)) over a named row builder sizes the result list
+            # once, instead of a comprehension growing it incrementally.
+            users = list(map(_user_row, page.items()))
+            return {
+                "users": users,
+                "count": len(users),
+                "offset": offset,
+                "next_offset": offset + limit if len(users) == limit else None,
+            }
 
-            `up_to` should be None to read all the pages.
+        return await _users_cache.get_or_fetch(
+            (evo_context.org_id, "users_page", offset, limit),
+            fetch_page,
+        )
+    
+    @mcp.tool()
+    async def check_current_user_roles() -> dict:
+        """Get the roles of the currently signed-in user in the selected instance.
 
-            Only supports raw API clients, not SDK clients that return a evo.common.Pages object.
-            """
-            offset = 0
-            ret = []
-            while True:
-                page = await func(offset=offset, limit=limit)
-                ret.extend(page.items())
+        Use this to check for admin or owner permissions before calling
+        `add_users_to_instance`, `remove_user_from_instance` or
+        `update_user_role_in_instance`; it avoids pulling the full user list
+        just to find the caller's own entry.
+        """
+        workspace_client = await get_workspace_client()
 
-                if len(page) < limit:
-                    break
+        # Prefer a dedicated "current user" endpoint when the SDK has one.
+        get_current = getattr(workspace_client, "get_current_user_roles", None)
+        if get_current is not None:
+            roles = await get_current()
+            return {"roles": list(map(_role_name, roles))}
+
+        # Otherwise identify the caller from the session token and scan the
+        # full user listing (fetched with concurrent pages) for their entry.
+        access_token = evo_context.get_access_token_from_cache()
+        if not access_token:
+            raise ValueError("No active session token; please re-authenticate.")
+
+        claims = jwt.decode(access_token, options={"verify_signature": False})
+        email = claims.get("email") or claims.get("preferred_username")
+        if not email:
+            raise ValueError("Could not determine the current user's email from the session token.")
+
+        instance_users = await read_pages_from_api(workspace_client.list_instance_users)
+        for user in instance_users:
+            if user.email == email:
+                return {
+                    "email": email,
+                    "roles": list(map(_role_name, user.roles)),
+                }
+
+        raise ValueError(f"User {email} is not a member of the selected instance.")
 
-                if up_to and len(ret) >= up_to:
-                    ret = ret[:up_to]
-                    break
+    @mcp.tool()
+    async def get_instance_roles_and_users(
+        user_count: int = 100,
+    ) -> dict:
+        """Fetch the instance roles and a first page of users together.
 
-                offset += limit
+        Prefer this over calling `list_roles_in_instance` and
+        `get_users_in_instance` back-to-back before a bulk add/update flow:
+        the two fetches are independent, so they are issued concurrently and
+        complete in one network round trip instead of two.
 
-            return ret
+        Args:
+            user_count: Maximum number of users to return in the first page.
+        """
+        workspace_client = await get_workspace_client()
 
-        instance_users = await read_pages_from_api(
-            functools.partial(
-                workspace_client.list_instance_users
-            ),
-            up_to=count,
+        instance_roles, users_page = await asyncio.gather(
+            list_instance_roles_cached(workspace_client),
+            workspace_client.list_instance_users(offset=0, limit=user_count),
         )
-        
-        return [
-            {
-                "user_id": user.user_id,
-                "email": user.email,
-                "name": user.full_name,
-                "roles": [role.name for role in user.roles]
-            }
-            for user in instance_users
-        ]
-    
+
+        return {
+            "roles": instance_roles,
+            "users": list(map(_user_row, users_page.items())),
+        }
+
     @mcp.tool()
     async def list_roles_in_instance(
     ) -> list[dict]:
         """List the roles available in the instance."""
         workspace_client = await get_workspace_client()
 
-        instance_roles_response = await workspace_client.list_instance_roles()
+        instance_roles_response = await list_instance_roles_cached(workspace_client)
         return instance_roles_response
 
     @mcp.tool()
     async def add_users_to_instance(
         user_emails: list[str],
-        role_ids: list[UUID],
+        role_ids: list[UUID] | None = None,
+        role_names: list[str] | None = None,
     ) -> dict|str:
         """Add one or more users to the selected instance.
         If the user is external, an invitation will be sent.
 
-        Only an instance admin or owner can add users to the instance. If a Forbidden error is returned from add_users_to_instance(), 
+        Only an instance admin or owner can add users to the instance. Use the
+        `check_current_user_roles` tool to verify permissions without listing every user.
+        If a Forbidden error is returned from add_users_to_instance(),
         inform the user of the tool that they do not have the required permissions to add users to the instance.
         If a user is already in the instance, an error will be returned - give the error details to the user of the tool
         and ask the user if they wish to update the role of this user. If role update is requested, use `update_user_role_in_instance` tool instead.
@@ -108,27 +273,85 @@ def register_instance_users_admin_tools(mcp):
         Args:
             user_emails: List of user email addresses to add.
             role_ids: List of role IDs to assign to the users. Must match
-                roles returned by `list_roles_in_instance`. If the user doesn't
-                specify a role, user the "Evo User" role for the selected
-                instance.
+                roles returned by `list_roles_in_instance`. If omitted, the
+                "Evo User" role for the selected instance is used.
+            role_names: Role names (e.g. "Evo User") to assign instead of
+                role_ids; they are resolved locally from the cached role
+                map, so no prior `list_roles_in_instance` call is needed.
 
         Returns:
             A dict with invitations sent and members added.
             Invitations are for external users who would need to accept the invitation to join the instance.
             Members are for users who are already part of the organization.
+            Large email lists are sent in batches; if some batches fail, the
+            successful ones still take effect and the failures are listed
+            under `failed_batches` with their emails and error details.
+            Only retry the emails from `failed_batches`, not the whole list.
         """
         workspace_client = await get_workspace_client()
-        
-        users = {email : role_ids for email in user_emails}
 
-        response = await workspace_client.add_users_to_instance(users=users)
+        if not role_ids:
+            role_map = await get_role_map(workspace_client)
+            if role_names:
+                missing = [name for name in role_names if name not in role_map]
+                if missing:
+                    raise ValueError(
+                        f"Unknown role names {missing}; check them against "
+                        "`list_roles_in_instance`."
+                    )
+                role_ids = [role_map[name].id for name in role_names]
+            else:
+                evo_user_role = role_map.get("Evo User")
+                if evo_user_role is None:
+                    raise ValueError(
+                        "No role_ids were provided and the selected instance has no "
+                        "'Evo User' role; pass role_ids from `list_roles_in_instance`."
+                    )
+                role_ids = [evo_user_role.id]
+
+        chunks = [
+            user_emails[i:i + _ADD_USERS_BATCH_SIZE]
+            for i in range(0, len(user_emails), _ADD_USERS_BATCH_SIZE)
+        ]
+        sem = asyncio.Semaphore(_ADD_USERS_CONCURRENCY)
+
+        async def send(chunk):
+            async with sem:
+                return await workspace_client.add_users_to_instance(
+                    users={email: role_ids for email in chunk}
+                )
+
+        # One failing batch (e.g. a user who is already a member) must not
+        # hide the batches that succeeded, so collect per-batch outcomes
+        # instead of letting the first error abort the gather.
+        responses = await asyncio.gather(
+            *(send(chunk) for chunk in chunks), return_exceptions=True
+        )
 
-        invitations = response.invitations or []
-        members = response.members or []
-        return {
+        # Membership may have changed even if some batches failed; cached
+        # user listings are stale either way.
+        _users_cache.invalidate()
+
+        invitations = []
+        members = []
+        failed_batches = []
+        for chunk, response in zip(chunks, responses):
+            if isinstance(response, BaseException):
+                failed_batches.append({
+                    "emails": chunk,
+                    "error": f"{type(response).__name__}: {response}",
+                })
+            else:
+                invitations.extend(response.invitations or [])
+                members.extend(response.members or [])
+
+        result = {
             "invitations_sent": [invitation.email for invitation in invitations],
             "members_added": [member.email for member in members],
         }
+        if failed_batches:
+            result["failed_batches"] = failed_batches
+        return result
 
     @mcp.tool()
     async def remove_user_from_instance(
@@ -150,6 +373,8 @@ def register_instance_users_admin_tools(mcp):
 
         await workspace_client.remove_instance_user(user_id=user_id)
 
+        _users_cache.invalidate()
+
         return {
             "user_removed": user_email,
         }
@@ -181,6 +406,8 @@ def register_instance_users_admin_tools(mcp):
 
         await workspace_client.update_instance_user_roles(user_id=user_id, roles=role_ids)
 
+        _users_cache.invalidate()
+
         return {
             "user_role_updated": user_email,
             "new_roles": role_ids,
@@ -26,6 +26,7 @@ import pandas as pd
 
 from evo.common.utils import Cache
 from evo_mcp.context import evo_context, ensure_initialized
+from evo_mcp.tools.data_tools import invalidate_versions_cache
 from evo_mcp.utils.object_builders import (
     PointsetBuilder,
     LineSegmentsBuilder,
@@ -188,7 +189,10 @@ def register_object_builder_tools(mcp):
             
             await data_client.upload_referenced_data(obj_dict)
             metadata = await object_client.create_geoscience_object(object_path, obj_dict)
-            
+            # Creating at an existing path adds a version; cached version
+            # listings are stale now.
+            invalidate_versions_cache()
+
             return {
                 "status": "created",
                 "object_id": str(metadata.id),
@@ -381,7 +385,10 @@ def register_object_builder_tools(mcp):
             
             await data_client.upload_referenced_data(obj_dict)
             metadata = await object_client.create_geoscience_object(object_path, obj_dict)
-            
+            # Creating at an existing path adds a version; cached version
+            # listings are stale now.
+            invalidate_versions_cache()
+
             return {
                 "status": "created",
                 "object_id": str(metadata.id),
@@ -638,7 +645,10 @@ def register_object_builder_tools(mcp):
             
             await data_client.upload_referenced_data(obj_dict)
             metadata = await object_client.create_geoscience_object(object_path, obj_dict)
-            
+            # Creating at an existing path adds a version; cached version
+            # listings are stale now.
+            invalidate_versions_cache()
+
             return {
                 "status": "created",
                 "object_id": str(metadata.id),
@@ -845,7 +855,10 @@ def register_object_builder_tools(mcp):
             
             await data_client.upload_referenced_data(obj_dict)
             metadata = await object_client.create_geoscience_object(object_path, obj_dict)
-            
+            # Creating at an existing path adds a version; cached version
+            # listings are stale now.
+            invalidate_versions_cache()
+
             return {
                 "status": "created",
                 "object_id": str(metadata.id),
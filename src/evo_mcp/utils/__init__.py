@@ -6,7 +6,8 @@
 Utility modules for Evo MCP operations.
 """
 
-from .evo_data_utils import extract_data_references, copy_object_data
+from .evo_data_utils import extract_data_references, iter_data_references, copy_object_data
+from .ttl_cache import AsyncTTLCache
 from .object_builders import (
     BaseObjectBuilder,
     PointsetBuilder,
@@ -16,7 +17,9 @@ from .object_builders import (
 
 __all__ = [
     'extract_data_references',
+    'iter_data_references',
     'copy_object_data',
+    'AsyncTTLCache',
     'BaseObjectBuilder',
     'PointsetBuilder',
     'LineSegmentsBuilder',
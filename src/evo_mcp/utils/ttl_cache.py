@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: 2026 Bentley Systems, Incorporated
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Small async TTL cache for slow-moving API results.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+
+class AsyncTTLCache:
+    """Async-safe cache with per-entry expiry and single-flight fetching.
+
+    Entries live for `ttl` seconds. Concurrent callers requesting the same
+    key while a fetch is in flight share that fetch instead of issuing
+    duplicate requests.
+    """
+
+    def __init__(self, ttl: float = 60.0):
+        self.ttl = ttl
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._locks: dict[Hashable, asyncio.Lock] = {}
+
+    async def get_or_fetch(
+        self,
+        key: Hashable,
+        fetcher: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """Return the cached value for `key`, calling `fetcher` on a miss."""
+        ttl = self.ttl if ttl is None else ttl
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Re-check after acquiring the lock: another caller may have
+            # completed the fetch while we waited.
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+
+            value = await fetcher()
+            self._entries[key] = (time.monotonic() + ttl, value)
+            return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop a single entry, or everything when no key is given."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)